@@ -1,8 +1,10 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, List, Dict
-from pydantic import BaseModel, Field, PrivateAttr
+from typing import Any, Optional, List, Dict, Deque, Callable, Set
+from collections import deque
+from dataclasses import dataclass, field
 import asyncio
+import time
 from loguru import logger
 
 from .loader import AutognomeConfig
@@ -13,66 +15,77 @@ from .state_store import StateStore, JsonStateStore, PersistentState
 from .mind import MockMind, ActionContext, Action, ActionResult, Rest
 from .llm_mind import LLMMind
 
-class Autognome(BaseModel):
+# Minimum seconds between environment checks in get_status() while resting
+RESTING_STATUS_INTERVAL = 2.0
+
+@dataclass(slots=True)
+class LifetimeStats:
+    """Totals carried over from previous sessions"""
+    total_pulses: int = 0
+    total_rests: int = 0
+    total_runtime: float = 0  # seconds
+    total_hibernation_time: float = 0  # seconds
+    wake_count: int = 1
+
+@dataclass(slots=True)
+class Autognome:
     """An autognome with energy management, emotional responses, and memory"""
-    config: AutognomeConfig = Field(
-        ...,
-        description="Loaded configuration for this autognome"
-    )
-    pulse_count: int = Field(
-        default=0, 
-        ge=0,
-        description="Number of pulses in current session"
-    )
-    rest_count: int = Field(
-        default=0,
-        ge=0,
-        description="Number of rests in current session"
-    )
-    energy_level: float = Field(
-        default=None,
-        ge=0,
-        description="Current energy level"
-    )
-    running: bool = Field(
-        default=True,
-        description="Whether the autognome is currently running"
-    )
-    emotional_state: str = Field(
-        default="normal",
-        description="Current emotional state"
-    )
-    mind_state: str = Field(
-        default="idle",
-        description="Current state of the mind"
-    )
-    remaining_rest_pulses: int = Field(
-        default=0,
-        ge=0,
-        description="Number of pulses left to rest"
-    )
+    config: AutognomeConfig  # Loaded configuration for this autognome
+    pulse_count: int = 0  # Number of pulses in current session
+    rest_count: int = 0  # Number of rests in current session
+    energy_level: Optional[float] = None  # Current energy level (initial energy if None)
+    running: bool = True  # Whether the autognome is currently running
+    emotional_state: str = "normal"  # Current emotional state
+    mind_state: str = "idle"  # Current state of the mind
+    remaining_rest_pulses: int = 0  # Number of pulses left to rest
     
-    # Private attributes not included in serialization
-    _sensor: EnvironmentSensor = PrivateAttr(default_factory=EnvironmentSensor)
-    _short_term_memory: ShortTermMemory = PrivateAttr()
-    _long_term_memory: LongTermMemoryStore = PrivateAttr()
-    _state_store: StateStore = PrivateAttr()
-    _last_observation: str = PrivateAttr(default="")
-    _last_energy_warning: str = PrivateAttr(default=None)
-    _startup_time: datetime = PrivateAttr()
-    _lifetime_stats: dict = PrivateAttr()
-    _base_dir: Path = PrivateAttr()
-    _mind: Any = PrivateAttr()  # Will be Mind protocol
-    _last_user_message: Optional[datetime] = PrivateAttr(default=None)
-    _conversation_history: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
-    _current_actions: List[Action] = PrivateAttr(default_factory=list)
-    
-    model_config = {
-        "arbitrary_types_allowed": True
-    }
+    # Private attributes, set up in __post_init__
+    _sensor: EnvironmentSensor = field(init=False, repr=False, default_factory=EnvironmentSensor)
+    _short_term_memory: ShortTermMemory = field(init=False, repr=False)
+    _long_term_memory: LongTermMemoryStore = field(init=False, repr=False)
+    _state_store: StateStore = field(init=False, repr=False)
+    _last_observation: str = field(init=False, repr=False, default="")
+    _announced_run: Optional[datetime] = field(init=False, repr=False, default=None)  # State run announced about
+    _announced_durations: Set[int] = field(init=False, repr=False, default_factory=set)  # Seconds already announced
+    _last_light_level: str = field(init=False, repr=False, default="unknown")  # Most recent sensor reading
+    _last_energy_warning: Optional[str] = field(init=False, repr=False, default=None)
+    _startup_monotonic: float = field(init=False, repr=False)  # time.monotonic() at startup
+    _lifetime_stats: LifetimeStats = field(init=False, repr=False)
+    _base_dir: Path = field(init=False, repr=False)
+    _mind: Any = field(init=False, repr=False)  # Will be Mind protocol
+    _last_user_message: Optional[datetime] = field(init=False, repr=False, default=None)
+    _conversation_history: Deque[Dict[str, Any]] = field(init=False, repr=False)
+    _current_actions: List[Action] = field(init=False, repr=False, default_factory=list)
+    _reflection_tasks: Set[asyncio.Task] = field(init=False, repr=False, default_factory=set)  # Running reflections
+    _dirty: bool = field(init=False, repr=False, default=False)  # State changed since last save
+    _last_saved: float = field(init=False, repr=False, default=0.0)  # time.monotonic() of last save
+    _save_interval: float = field(init=False, repr=False, default=5.0)  # Min seconds between checkpoints
+    _save_task: Optional[asyncio.Task] = field(init=False, repr=False, default=None)  # Running checkpoint write
+    _state_seq: int = field(init=False, repr=False, default=0)  # Orders state snapshots for the store
+    _has_shutdown: bool = field(init=False, repr=False, default=False)  # Shutdown memory stored
+    _ascii_art: Dict[str, str] = field(init=False, repr=False, default_factory=dict)
+    _tick_cache: Dict[str, Any] = field(init=False, repr=False, default_factory=dict)  # Cleared every tick
+    _tick_now: Optional[datetime] = field(init=False, repr=False, default=None)  # Timestamp of current tick
+    _status_cache: Optional[tuple] = field(init=False, repr=False, default=None)  # (status key, status dict)
+    _status_pulse: int = field(init=False, repr=False, default=-1)  # Pulse of the last full status
+    _last_full_status: float = field(init=False, repr=False, default=0.0)  # time.monotonic() of last sensing
+    # Energy thresholds, derived from config once in __post_init__
+    _energy_high: float = field(init=False, repr=False)
+    _energy_warning: float = field(init=False, repr=False)
+    _energy_critical: float = field(init=False, repr=False)
+    _optimal_high: float = field(init=False, repr=False)
+    _optimal_low: float = field(init=False, repr=False)
+    _max_energy: float = field(init=False, repr=False)
+    _recovery_rate: float = field(init=False, repr=False)
+    _depletion_rate: float = field(init=False, repr=False)
 
-    def model_post_init(self, __context: Any) -> None:
-        """Initialize after model validation"""
+    def __post_init__(self) -> None:
+        """Initialize after construction"""
+        if self.energy_level is not None and self.energy_level < 0:
+            raise ValueError("energy_level must be >= 0")
+        if min(self.pulse_count, self.rest_count, self.remaining_rest_pulses) < 0:
+            raise ValueError("pulse_count, rest_count and remaining_rest_pulses must be >= 0")
+        
         # Set up base directory for this AG
         self._base_dir = Path("data/autognomes") / self.config.version
         
@@ -81,9 +94,36 @@ class Autognome(BaseModel):
             capacity=self.config.memory["short_term_capacity"]
         )
         
+        # Precompute energy thresholds used on every pulse
+        core = self.config.core
+        initial = core["initial_energy"]
+        optimal = core["optimal_energy"]
+        self._energy_high = initial * 0.9
+        self._energy_warning = initial * 0.5
+        self._energy_critical = initial * 0.3
+        self._optimal_high = optimal + 0.5
+        self._optimal_low = optimal - 0.5
+        self._max_energy = optimal * 1.5
+        self._recovery_rate = core["energy_recovery_rate"]
+        self._depletion_rate = core["energy_depletion_rate"]
+        
+        self._save_interval = self.config.memory.get("state_save_interval", 5.0)
+        
+        # Load ASCII art once, rather than on every status update
+        self._load_ascii_art()
+        
+        # Only keep as much conversation as the mind gets to see
+        self._conversation_history = deque(
+            maxlen=self.config.mind.get("conversation", {}).get("max_history", 10)
+        )
+        
         # Initialize state storage with full paths
         self._state_store = JsonStateStore(self._base_dir)
-        self._long_term_memory = JsonlMemoryStore(self._base_dir)
+        self._long_term_memory = JsonlMemoryStore(
+            self._base_dir,
+            batch_size=self.config.memory.get("flush_batch_size", 20),
+            flush_interval=self.config.memory.get("flush_interval", 30.0)
+        )
         
         # Initialize mind based on config
         if self.config.mind["type"] == "mock":
@@ -103,31 +143,25 @@ class Autognome(BaseModel):
             # Initialize with previous state
             self.energy_level = prev_state.energy_level
             self.emotional_state = prev_state.emotional_state
-            self._lifetime_stats = {
-                'total_pulses': prev_state.total_pulses,
-                'total_rests': prev_state.total_rests,
-                'total_runtime': prev_state.total_runtime,
-                'total_hibernation_time': prev_state.total_hibernation_time + hibernation_time,
-                'wake_count': prev_state.wake_count + 1
-            }
+            self._lifetime_stats = LifetimeStats(
+                total_pulses=prev_state.total_pulses,
+                total_rests=prev_state.total_rests,
+                total_runtime=prev_state.total_runtime,
+                total_hibernation_time=prev_state.total_hibernation_time + hibernation_time,
+                wake_count=prev_state.wake_count + 1
+            )
         else:
             # Initialize fresh state
             if self.energy_level is None:
                 self.energy_level = self.config.core["initial_energy"]
-            self._lifetime_stats = {
-                'total_pulses': 0,
-                'total_rests': 0,
-                'total_runtime': 0,
-                'total_hibernation_time': 0,
-                'wake_count': 1
-            }
+            self._lifetime_stats = LifetimeStats()
             
-        self._startup_time = datetime.now()
+        self._startup_monotonic = time.monotonic()
         
         # Store startup event with wake count
         self._store_memory(
             "startup", 
-            f"I am {self.config.name}, and I have awakened for the {self._lifetime_stats['wake_count']} time!"
+            f"I am {self.config.name}, and I have awakened for the {self._lifetime_stats.wake_count} time!"
         )
         
         # Save initial state
@@ -144,23 +178,53 @@ class Autognome(BaseModel):
                 "running": self.running,
                 "energy_state": self.sense_energy_state()
             },
-            short_term=self._short_term_memory.analyze_patterns(),
-            long_term=self._long_term_memory.get_recent(5),
+            short_term=self._analyze_patterns(),
+            long_term=self._tick_cached("recent_memories", lambda: self._long_term_memory.get_recent(5)),
             sensors={
-                "light": self._sensor.read_light_level()
+                "light": self._read_light_level()
             },
-            conversation=self._conversation_history[-10:],  # Last 10 messages
+            conversation=list(self._conversation_history),  # Last max_history messages
             last_user_message=self._last_user_message
         )
 
+    def _now(self) -> datetime:
+        """Current time, taken once per tick (act() or get_status() call)"""
+        return self._tick_now or datetime.now()
+
+    def _tick_cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Compute a value at most once per tick (act() or get_status() call)"""
+        if key not in self._tick_cache:
+            self._tick_cache[key] = compute()
+        return self._tick_cache[key]
+
+    def _read_light_level(self) -> LightLevel:
+        """Read the light sensor, at most once per tick"""
+        if "light" not in self._tick_cache:
+            self._tick_cache["light"] = self._last_light_level = self._sensor.read_light_level()
+        return self._tick_cache["light"]
+
+    async def _aread_light_level(self) -> LightLevel:
+        """Read the light sensor off the event loop, at most once per tick"""
+        if "light" not in self._tick_cache:
+            self._tick_cache["light"] = self._last_light_level = await self._sensor.aread_light_level()
+        return self._tick_cache["light"]
+
+    def _analyze_patterns(self) -> dict:
+        """Analyze short-term memory patterns, at most once per tick"""
+        return self._tick_cached("patterns", self._short_term_memory.analyze_patterns)
+
     def _process_observation(self, had_transition: bool = False) -> Optional[str]:
         """Centralized observation processing.
         Returns a message if there's a new observation to report."""
         observation = None
-        
+        patterns = self._analyze_patterns()
+
+        # Common case: no transition and no duration milestone reached yet
+        if not had_transition and patterns["current_state_duration"] < 60:
+            return None
+
         # First check transition-based observations
         if had_transition:
-            patterns = self._short_term_memory.analyze_patterns()
             transitions = patterns["transitions_last_minute"]
             if transitions > 5:
                 observation = f"The light is changing so quickly! {transitions} times in the last minute!"
@@ -169,14 +233,21 @@ class Autognome(BaseModel):
         
         # Then check time-based observations
         if not observation:  # Only if we don't have a transition observation
-            patterns = self._short_term_memory.analyze_patterns()
+            # Announce each duration milestone once per stretch of the same state
+            run_start = self._short_term_memory.last_transition_time
+            if run_start != self._announced_run:
+                self._announced_run = run_start
+                self._announced_durations.clear()
+            
             duration = patterns["current_state_duration"]
             current_state = self._short_term_memory.last_state or "unknown"
             
-            if 59 < duration < 61:  # Just reached 1 minute
-                observation = f"It's been {current_state} for a minute now..."
-            elif 299 < duration < 301:  # Just reached 5 minutes
+            if duration >= 300 and 300 not in self._announced_durations:  # Reached 5 minutes
                 observation = f"It's been {current_state} for quite a while now... ({int(duration/60)} minutes)"
+                self._announced_durations.update((60, 300))
+            elif duration >= 60 and 60 not in self._announced_durations:  # Reached 1 minute
+                observation = f"It's been {current_state} for a minute now..."
+                self._announced_durations.add(60)
         
         # Store and return if we have a new observation
         if observation and observation != self._last_observation:
@@ -190,6 +261,12 @@ class Autognome(BaseModel):
         """Perform one pulse of activity."""
         # Increment pulse count at start of each pulse
         self.pulse_count += 1
+        self._tick_cache.clear()
+        self._tick_now = datetime.now()
+        
+        # Periodically persist state, but only if something changed
+        if self._dirty and time.monotonic() - self._last_saved >= self._save_interval:
+            self._checkpoint_state()
         
         # If we're still resting, continue resting
         if self.remaining_rest_pulses > 0:
@@ -198,57 +275,90 @@ class Autognome(BaseModel):
             self.mind_state = "resting"
             return None
 
+        # Read the sensor without blocking the loop, the tick reuses the reading
+        await self._aread_light_level()
+        
         # Build context for mind
         context = self._build_context()
         
         # Think and get actions
+        message = None
         try:
             actions = await self._mind.think(context)
             self.mind_state = "acting"
             self._current_actions = actions
             
             # Execute actions
-            message = None
-            for action in actions:
-                result = await action.execute(context)
+            results = await self._execute_actions(actions, context)
+            for action, result in zip(actions, results):
                 if not result.success:
                     logger.error(f"Action failed: {result.message}")
                     continue
                     
                 # Handle rest actions specially
-                if isinstance(action, Rest):
-                    self.remaining_rest_pulses = action.pulses - 1  # -1 since we're using this pulse
-                    self._recover_energy()
-                    self.mind_state = "resting"
-                    self.rest_count += 1  # Increment rest count
-                    return "Taking a rest..."
+                if isinstance(action, Rest):  # Resting recovers energy instead of spending it
+                    return self._handle_rest(action)
                 
                 # Store messages from speak actions
                 if result.metadata.get("type") == "speak":
-                    message = result.message
-                    self._conversation_history.append({
-                        "role": "assistant",
-                        "content": message,
-                        "timestamp": datetime.now()
-                    })
+                    message = self._handle_speak(result)
                     
-            # Reflect on actions
-            try:
-                await self._mind.reflect(context, actions)
-            except Exception as e:
-                logger.exception("Error in mind reflection")
-                # Don't change mind state or return error - just log it
-            
-            return message
+            # Reflect on actions in the background, the pulse doesn't need the result
+            task = asyncio.create_task(self._reflect(context, actions))
+            self._reflection_tasks.add(task)
+            task.add_done_callback(self._reflection_tasks.discard)
             
         except Exception as e:
             logger.exception("Error in mind processing")
             self.mind_state = "error"
-            return f"Error: {str(e)}"
+            message = f"Error: {str(e)}"
             
-        # If we got here, we did work this pulse
+        # Thinking costs energy whether or not the pulse went well. The state
+        # is saved by the periodic checkpoint at the start of the next pulse.
         self._deplete_energy()
-        self._save_state()
+        return message
+
+    async def _reflect(self, context: ActionContext, actions: List[Action]) -> None:
+        """Let the mind reflect on this pulse's actions"""
+        try:
+            await self._mind.reflect(context, actions)
+        except Exception as e:
+            logger.exception("Error in mind reflection")
+            # Don't change mind state or return error - just log it
+
+    def _handle_rest(self, action: Rest) -> str:
+        """Start resting for the requested number of pulses"""
+        self.remaining_rest_pulses = action.pulses - 1  # -1 since we're using this pulse
+        self._recover_energy()
+        self.mind_state = "resting"
+        self.rest_count += 1  # Increment rest count
+        self._dirty = True
+        return "Taking a rest..."
+
+    def _handle_speak(self, result: ActionResult) -> str:
+        """Record a spoken message in the conversation history"""
+        self._conversation_history.append({
+            "role": "assistant",
+            "content": result.message,
+            "timestamp": self._now()
+        })
+        return result.message
+
+    async def _execute_actions(self, actions: List[Action], context: ActionContext) -> List[ActionResult]:
+        """Execute actions, running parallel-safe ones concurrently.
+        Results are returned in the same order as the actions."""
+        results: List[Optional[ActionResult]] = [None] * len(actions)
+        
+        parallel = [i for i, action in enumerate(actions) if action.parallel_safe]
+        if parallel:
+            gathered = await asyncio.gather(*(actions[i].execute(context) for i in parallel))
+            for i, result in zip(parallel, gathered):
+                results[i] = result
+        
+        for i, action in enumerate(actions):
+            if results[i] is None:
+                results[i] = await action.execute(context)
+        return results
 
     def record_user_message(self, message: str) -> None:
         """Record a message from the user"""
@@ -261,6 +371,26 @@ class Autognome(BaseModel):
 
     def get_status(self) -> dict:
         """Get the current status of the autognome"""
+        # While resting (and awake), don't re-sense the environment if we just did
+        if (self.running and self.remaining_rest_pulses > 0 and self._status_cache and
+                time.monotonic() - self._last_full_status < RESTING_STATUS_INTERVAL):
+            return {
+                **self._status_cache[1],
+                "energy": self.energy_level,
+                "pulse": self.pulse_count,
+                "rest_count": self.rest_count,
+                "mind_state": self.mind_state,
+                "ascii_art": self._get_ascii_art(False)  # Cached statuses never carry an observation
+            }
+        
+        # The first status after a pulse reuses that pulse's sensor readings,
+        # any further status before the next pulse starts a fresh tick
+        if self._status_pulse == self.pulse_count:
+            self._tick_cache.clear()
+            self._tick_now = datetime.now()
+        self._status_pulse = self.pulse_count
+        self._last_full_status = time.monotonic()
+        
         # First get environment and update emotional state
         light_level, had_transition = self.sense_environment()
         self.update_emotional_state(light_level)
@@ -269,7 +399,15 @@ class Autognome(BaseModel):
         observation = self._process_observation(had_transition)
         is_observing = bool(observation)
         
-        return {
+        # Reuse the last status if nothing shown in it has changed
+        status_key = (
+            self.energy_level, self.pulse_count, self.rest_count, light_level,
+            self.emotional_state, self.mind_state, self.running
+        )
+        if not is_observing and self._status_cache and self._status_cache[0] == status_key:
+            return self._status_cache[1]
+        
+        status = {
             "state": "active",
             "display_state": self.emotional_state,
             "energy": self.energy_level,
@@ -284,10 +422,29 @@ class Autognome(BaseModel):
             "ascii_art": self._get_ascii_art(is_observing),
             "observation": observation  # Include any observation message
         }
+        if is_observing:  # Observations must only be reported once, cache a copy without it
+            self._status_cache = (status_key, {
+                **status,
+                "is_observing": False,
+                "ascii_art": self._get_ascii_art(False),
+                "observation": None
+            })
+        else:
+            self._status_cache = (status_key, status)
+        return status
+
+    def _load_ascii_art(self) -> None:
+        """Read all configured ASCII art files into memory"""
+        for art_key, art_file in self.config.display["ascii_art"].items():
+            art_path = self._base_dir / art_file
+            try:
+                with open(art_path) as f:
+                    self._ascii_art[art_key] = f.read()
+            except Exception as e:
+                self._ascii_art[art_key] = f"Error loading ASCII art: {e}"
 
     def _get_ascii_art(self, is_observing: bool) -> str:
         """Get appropriate ASCII art based on state"""
-        ascii_art = self.config.display["ascii_art"]
         if not self.running:
             art_key = "sleeping"
         elif is_observing or self.mind_state in ["thinking", "researching"]:
@@ -295,61 +452,78 @@ class Autognome(BaseModel):
         else:
             art_key = self.emotional_state
             
-        art_path = self._base_dir / ascii_art[art_key]
-        try:
-            with open(art_path) as f:
-                return f.read()
-        except Exception as e:
-            return f"Error loading ASCII art: {e}"
+        return self._ascii_art.get(art_key, f"Error loading ASCII art: no art for '{art_key}'")
 
     def _save_state(self) -> None:
         """Save current state to persistent storage"""
-        now = datetime.now()
-        runtime = (now - self._startup_time).total_seconds()
+        self._state_seq += 1
+        self._state_store.save_state(self._build_persistent_state(), self._state_seq)
+        self._dirty = False
+        self._last_saved = time.monotonic()
+
+    def _checkpoint_state(self) -> None:
+        """Snapshot state now and write it from a worker thread, off the pulse path"""
+        if self._save_task and not self._save_task.done():
+            return  # Previous checkpoint still writing, try again next pulse
+        self._state_seq += 1
+        self._save_task = asyncio.create_task(
+            asyncio.to_thread(self._state_store.save_state, self._build_persistent_state(), self._state_seq)
+        )
+        self._save_task.add_done_callback(self._checkpoint_done)
+        self._dirty = False
+        self._last_saved = time.monotonic()
+
+    def _checkpoint_done(self, task: asyncio.Task) -> None:
+        """Log a failed checkpoint and mark state dirty so a later pulse retries it"""
+        if not task.cancelled() and task.exception():
+            logger.error(f"Error saving state checkpoint: {task.exception()}")
+            self._dirty = True
+
+    def _build_persistent_state(self) -> PersistentState:
+        """Snapshot the current state for persistence"""
+        now = self._now()
+        runtime = time.monotonic() - self._startup_monotonic
         
-        state = PersistentState(
+        return PersistentState(
             energy_level=self.energy_level,
             emotional_state=self.emotional_state,
-            last_light_level=self._sensor.read_light_level(),
+            last_light_level=self._last_light_level,
             last_active=now,
             last_hibernation=now if not self.running else None,
-            total_pulses=self._lifetime_stats['total_pulses'] + self.pulse_count,
-            total_rests=self._lifetime_stats['total_rests'] + self.rest_count,
-            total_runtime=self._lifetime_stats['total_runtime'] + runtime,
-            total_hibernation_time=self._lifetime_stats['total_hibernation_time'],
-            wake_count=self._lifetime_stats['wake_count']
+            total_pulses=self._lifetime_stats.total_pulses + self.pulse_count,
+            total_rests=self._lifetime_stats.total_rests + self.rest_count,
+            total_runtime=self._lifetime_stats.total_runtime + runtime,
+            total_hibernation_time=self._lifetime_stats.total_hibernation_time,
+            wake_count=self._lifetime_stats.wake_count
         )
-        self._state_store.save_state(state)
 
     def get_lifetime_stats(self) -> dict:
         """Get the current lifetime statistics"""
-        now = datetime.now()
-        runtime = (now - self._startup_time).total_seconds()
+        runtime = time.monotonic() - self._startup_monotonic
         
         return {
-            'total_pulses': self._lifetime_stats['total_pulses'] + self.pulse_count,
-            'total_rests': self._lifetime_stats['total_rests'] + self.rest_count,
-            'total_runtime': self._lifetime_stats['total_runtime'] + runtime,
-            'total_hibernation_time': self._lifetime_stats['total_hibernation_time'],
-            'wake_count': self._lifetime_stats['wake_count'],
+            'total_pulses': self._lifetime_stats.total_pulses + self.pulse_count,
+            'total_rests': self._lifetime_stats.total_rests + self.rest_count,
+            'total_runtime': self._lifetime_stats.total_runtime + runtime,
+            'total_hibernation_time': self._lifetime_stats.total_hibernation_time,
+            'wake_count': self._lifetime_stats.wake_count,
             'current_session_runtime': runtime
         }
 
     def _should_warn_energy(self) -> tuple[bool, str]:
         """Determine if we should store an energy-related memory"""
-        initial = self.config.core["initial_energy"]
-        if self.energy_level >= initial * 0.9:  # Very high energy
+        if self.energy_level >= self._energy_high:  # Very high energy
             return True, "energy_high"
-        elif self.energy_level <= initial * 0.3:  # Critical low
+        elif self.energy_level <= self._energy_critical:  # Critical low
             return True, "energy_critical"
-        elif self.energy_level <= initial * 0.5:  # Warning low
+        elif self.energy_level <= self._energy_warning:  # Warning low
             return True, "energy_warning"
         return False, ""
 
     def sense_environment(self) -> tuple[LightLevel, bool]:
         """Read the current light level and record it in memory.
         Returns (level, had_transition)"""
-        level = self._sensor.read_light_level()
+        level = self._read_light_level()
         # Record state with more details
         event = self._short_term_memory.record_state(
             level,
@@ -357,23 +531,22 @@ class Autognome(BaseModel):
         )
         # If there was a transition, store it in long-term memory too
         if event:
+            self._tick_cache.pop("patterns", None)  # Patterns now include the transition
             self._store_memory("light_change", event.details)
         return level, bool(event)
 
     def _store_memory(self, event_type: str, observation: str) -> None:
         """Store a new long-term memory"""
-        from datetime import datetime
-        
         # During shutdown, don't try to read sensors
         if event_type == "shutdown":
             light_level = "unknown"
             energy_state = "shutdown"
         else:
-            light_level = self._sensor.read_light_level()
+            light_level = self._read_light_level()
             energy_state = self.sense_energy_state()
             
         memory = LongTermMemory(
-            timestamp=datetime.now(),
+            timestamp=self._now(),
             event_type=event_type,
             state={
                 "energy_level": self.energy_level,
@@ -399,40 +572,48 @@ class Autognome(BaseModel):
                 f"I'm feeling {new_state} now... (was {self.emotional_state})"
             )
             self.emotional_state = new_state
+            self._dirty = True
 
     def sense_energy_state(self) -> str:
         """Determine current energy state relative to optimal"""
-        optimal = self.config.core["optimal_energy"]
-        if self.energy_level >= optimal + 0.5:
+        if self.energy_level >= self._optimal_high:
             return "high"
-        elif self.energy_level <= optimal - 0.5:
+        elif self.energy_level <= self._optimal_low:
             return "low"
         return "optimal"
 
     def stop(self) -> None:
         """Stop the autognome's pulsing and save state"""
-        if not hasattr(self, '_has_shutdown'):  # Only store shutdown memory once
+        self._tick_now = None  # Not part of a tick, use the real time
+        for task in self._reflection_tasks:
+            task.cancel()
+        if not self._has_shutdown:  # Only store shutdown memory once
             self._store_memory(
                 "shutdown", 
                 f"Going to sleep... Final energy: {self.energy_level:.1f}"
             )
-            self._save_state()  # Save state before shutting down
             self.mind_state = "sleeping"
             self._has_shutdown = True
+        # Persist buffered memories and state on every stop, memories may
+        # have been stored since waking up from an earlier one
+        self._state_seq += 1
+        self._state_store.save_and_flush_memories(
+            self._build_persistent_state(),
+            self._long_term_memory,
+            self._state_seq
+        )
+        self._long_term_memory.close()
+        self._dirty = False
         self.running = False 
 
     def _recover_energy(self) -> None:
         """Recover energy during rest."""
-        recovery = self.config.core["energy_recovery_rate"]
-        max_energy = self.config.core["optimal_energy"] * 1.5
-        self.energy_level = min(
-            self.energy_level + recovery,
-            max_energy
-        )
+        energy = self.energy_level + self._recovery_rate
+        self.energy_level = energy if energy < self._max_energy else self._max_energy
+        self._dirty = True
         
     def _deplete_energy(self) -> None:
         """Deplete energy when doing work."""
-        self.energy_level = max(
-            0.0,
-            self.energy_level - self.config.core["energy_depletion_rate"]
-        ) 
\ No newline at end of file
+        energy = self.energy_level - self._depletion_rate
+        self.energy_level = energy if energy > 0.0 else 0.0
+        self._dirty = True 
\ No newline at end of file
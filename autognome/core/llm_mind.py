@@ -1,11 +1,64 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
+import orjson
 from loguru import logger
 from litellm import completion, supports_function_calling
 from .mind import Action, Speak, Rest, Research
 
+# Function schemas offered to the LLM, built once rather than per instance
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "speak",
+            "description": "Communicate a message",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "message": {
+                        "type": "string",
+                        "description": "The message to communicate"
+                    }
+                },
+                "required": ["message"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "rest",
+            "description": "Rest for a number of pulses when tired",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "pulses": {
+                        "type": "integer",
+                        "description": "Number of pulses to rest for"
+                    }
+                },
+                "required": ["pulses"]
+            }
+        }
+    }
+]
+
+CONTEXT_TEMPLATE = """Current state:
+- Energy level: {energy_level}
+- Emotional state: {emotional_state}
+- Environment: {light_level} conditions
+- Pulse count: {pulse_count}
+- Rest count: {rest_count}
+
+Recent activity:
+{transitions}
+{recent_conversation}
+
+What would you like to do? Use the available functions to take actions."""
+
 class LLMMind:
+    tools = TOOLS
+    
     def __init__(self, config: Dict[str, Any]):
         self.model = config["model"]
         self.system_prompt = config["system_prompt"]
@@ -15,44 +68,6 @@ class LLMMind:
             "speak": lambda message: Speak(message=message),
             "rest": lambda pulses: Rest(pulses=pulses)
         }
-        
-        # Define function schemas for LLM
-        self.tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "speak",
-                    "description": "Communicate a message",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "message": {
-                                "type": "string",
-                                "description": "The message to communicate"
-                            }
-                        },
-                        "required": ["message"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "rest",
-                    "description": "Rest for a number of pulses when tired",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "pulses": {
-                                "type": "integer",
-                                "description": "Number of pulses to rest for"
-                            }
-                        },
-                        "required": ["pulses"]
-                    }
-                }
-            }
-        ]
 
     async def think(self, context: Dict[str, Any]) -> List[Action]:
         try:
@@ -89,7 +104,7 @@ class LLMMind:
             if message.tool_calls:
                 for tool_call in message.tool_calls:
                     function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
+                    function_args = orjson.loads(tool_call.function.arguments)
                     
                     if function_name in self.functions:
                         action = self.functions[function_name](**function_args)
@@ -100,14 +115,14 @@ class LLMMind:
                 try:
                     # Split content by semicolon and parse each action
                     for action_json in message.content.split(';'):
-                        content = json.loads(action_json.strip())
+                        content = orjson.loads(action_json.strip())
                         function_name = content.get("name")
                         function_args = content.get("arguments", {})
                         
                         if function_name in self.functions:
                             action = self.functions[function_name](**function_args)
                             actions.append(action)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Could not parse content as JSON: {message.content}")
                     return [Speak(message="I'm having trouble expressing myself clearly.")]
             
@@ -162,15 +177,12 @@ class LLMMind:
                     for msg in filtered_messages
                 )
 
-        return f"""Current state:
-- Energy level: {energy_level}
-- Emotional state: {emotional_state}
-- Environment: {light_level} conditions
-- Pulse count: {pulse_count}
-- Rest count: {rest_count}
-
-Recent activity:
-{transitions}
-{recent_conversation}
-
-What would you like to do? Use the available functions to take actions.""" 
\ No newline at end of file
+        return CONTEXT_TEMPLATE.format(
+            energy_level=energy_level,
+            emotional_state=emotional_state,
+            light_level=light_level,
+            pulse_count=pulse_count,
+            rest_count=rest_count,
+            transitions=transitions,
+            recent_conversation=recent_conversation
+        )
@@ -2,10 +2,22 @@ from pathlib import Path
 import yaml
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+from functools import lru_cache
 from loguru import logger
 from litellm import supports_function_calling
 
-@dataclass
+@lru_cache(maxsize=None)
+def _supports_function_calling(model: str) -> bool:
+    """Cached model capability lookup, support doesn't change within a process"""
+    return supports_function_calling(model)
+
+# Use libyaml's C parser when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs by version, with the file mtime they were parsed at so edits are picked up
+_config_cache: Dict[str, tuple[int, "AutognomeConfig"]] = {}
+
+@dataclass(slots=True, frozen=True)
 class AutognomeConfig:
     """Configuration loaded from YAML"""
     version: str
@@ -34,19 +46,26 @@ class AutognomeLoader:
         config_path = Path("data/autognomes") / version / "ag.yaml"
         
         try:
+            mtime = config_path.stat().st_mtime_ns
+            cached = _config_cache.get(version)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
             with open(config_path) as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=YamlLoader)
                 
             # Check if using LLM and validate function call support
             if config_data.get("mind", {}).get("type") == "llm":
                 model = config_data["mind"]["model"]
-                if not supports_function_calling(model):
+                if not _supports_function_calling(model):
                     raise ValueError(
                         f"Model {model} does not support function calling. "
                         "Please use a model that supports function calling or use mock mind type."
                     )
                 
-            return AutognomeConfig(**config_data)
+            config = AutognomeConfig(**config_data)
+            _config_cache[version] = (mtime, config)
+            return config
             
         except Exception as e:
             logger.error(f"Error loading config from {config_path}: {e}")
@@ -3,8 +3,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
+import os
+import queue
+import threading
+import time
+import orjson
+from loguru import logger
 
-@dataclass
+# Bytes read at a time when parsing the memory file
+READ_CHUNK_SIZE = 64 * 1024
+
+@dataclass(slots=True)
 class LongTermMemory:
     """A single long-term memory entry"""
     timestamp: datetime
@@ -22,6 +31,21 @@ class LongTermMemoryStore(ABC):
         """Store a new memory"""
         pass
     
+    @abstractmethod
+    def flush(self, sync: bool = True) -> None:
+        """Persist any buffered memories, syncing to disk unless sync is False"""
+        pass
+    
+    @abstractmethod
+    def sync(self) -> None:
+        """Sync previously flushed memories to disk"""
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and release any open resources"""
+        pass
+    
     @abstractmethod
     def search_similar(self, query: str, limit: int = 5) -> List[LongTermMemory]:
         """Find memories similar to the query"""
@@ -43,36 +67,177 @@ class LongTermMemoryStore(ABC):
         pass
 
 class JsonlMemoryStore(LongTermMemoryStore):
-    """Simple JSONL implementation for initial testing"""
-    def __init__(self, memory_dir: Path):
+    """Simple JSONL implementation for initial testing.
+    
+    Memories are buffered in memory and handed to a background writer
+    thread in batches, once `batch_size` memories are pending or
+    `flush_interval` seconds have passed since the last batch (the writer
+    checks this itself, so memories don't wait for the next store()). The
+    writer appends each batch with a single write to a descriptor it keeps
+    open in append mode. Call `flush()` or `close()` before shutting down to
+    wait for everything to reach the file.
+    
+    Memories already in the file are parsed once and kept in memory; each
+    query only parses lines appended since the previous one."""
+    def __init__(self, memory_dir: Path, batch_size: int = 20, flush_interval: float = 30.0):
         self.memory_dir = memory_dir
         self.memory_file = memory_dir / "memories.jsonl"
         self.memory_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Memories not yet handed to the writer, and batches handed to it but
+        # not yet in the file, both guarded by _lock
+        self._buffer: List[LongTermMemory] = []
+        self._in_flight: List[LongTermMemory] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._batches: queue.Queue = queue.Queue()
+        self._fd: Optional[int] = None  # Opened by the writer on first write
+        # Memories parsed from the file so far and the offset parsed up to, guarded by _lock
+        self._memories: List[LongTermMemory] = []
+        self._file_pos = 0
+        # Memories are stored in timestamp order unless the clock went backwards
+        self._in_order = True
+        self._last_stored: Optional[datetime] = None
+        # Running summary of the session started by the last startup memory stored here
+        self._session_start: Optional[LongTermMemory] = None
+        self._session_last: Optional[LongTermMemory] = None
+        self._session_counts: Dict[str, int] = {}
+        self._session_total = 0
+        self._writer: Optional[threading.Thread] = None  # Started by the first store()
         
     def store(self, memory: LongTermMemory) -> None:
-        """Store a new memory as a JSON line"""
-        import json
-        memory_dict = {
-            "timestamp": memory.timestamp.isoformat(),
-            "event_type": memory.event_type,
-            "state": memory.state,
-            "observation": memory.observation,
-            "emotional_state": memory.emotional_state,
-            "context": memory.context
-        }
-        with open(self.memory_file, "a") as f:
-            f.write(json.dumps(memory_dict) + "\n")
+        """Buffer a new memory, handing the batch to the writer if it is due"""
+        if self._last_stored and memory.timestamp < self._last_stored:
+            self._in_order = False
+        self._last_stored = memory.timestamp
+        if memory.event_type == "startup":
+            self._session_start = memory
+            self._session_counts = {}
+            self._session_total = 0
+        if self._session_start:
+            self._session_counts[memory.event_type] = self._session_counts.get(memory.event_type, 0) + 1
+            self._session_total += 1
+            self._session_last = memory
+        with self._lock:
+            self._buffer.append(memory)
+            due = len(self._buffer) >= self.batch_size
+        self._start_writer()
+        if due:
+            self._submit(sync=True)
+            
+    def flush(self, sync: bool = True) -> None:
+        """Write all buffered memories and wait until they are in the file"""
+        self._submit(sync)
+        self._batches.join()
+        
+    def _start_writer(self) -> None:
+        """Start the writer thread if it isn't running"""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_batches, daemon=True)
+            self._writer.start()
+        
+    def _submit(self, sync: bool) -> None:
+        """Hand the buffered memories to the writer thread"""
+        self._start_writer()
+        with self._lock:  # Queue under the lock so batches are written in the order taken
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            self._in_flight.extend(batch)
+            self._batches.put((batch, sync))
+        
+    def _write_batches(self) -> None:
+        """Writer thread: append each batch as JSON lines in a single write,
+        and submit buffered memories once they have waited flush_interval seconds"""
+        while True:
+            try:
+                item = self._batches.get(
+                    timeout=max(self._last_flush + self.flush_interval - time.monotonic(), 0)
+                )
+            except queue.Empty:
+                self._submit(sync=True)
+                continue
+            if item is None:  # Sent by close()
+                self._batches.task_done()
+                return
+            batch, sync = item
+            written = 0
+            landed = False  # Batch is in the file and out of _in_flight
+            try:
+                lines = memoryview(b"".join(self._serialize(memory) for memory in batch))
+                if self._fd is None:
+                    self._fd = os.open(
+                        self.memory_file,
+                        os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                        0o644
+                    )
+                with self._lock:
+                    while written < len(lines):  # os.write may write less than asked
+                        written += os.write(self._fd, lines[written:])
+                    del self._in_flight[:len(batch)]  # Batches are written in the order queued
+                    landed = True
+                if sync:
+                    os.fsync(self._fd)
+            except Exception as e:
+                if landed:
+                    logger.error(f"Error syncing memories to {self.memory_file}: {e}")
+                else:
+                    with self._lock:
+                        del self._in_flight[:len(batch)]
+                        if not written:  # Nothing reached the file, retry with the next batch
+                            self._buffer[:0] = batch
+                    if written:
+                        logger.error(
+                            f"Dropped {len(batch)} memories after a partial write to {self.memory_file}: {e}"
+                        )
+                    else:
+                        logger.error(f"Error writing memories to {self.memory_file}, will retry: {e}")
+            finally:
+                self._batches.task_done()
+        
+    def sync(self) -> None:
+        """Sync the memory file to disk"""
+        if self._fd is not None:
+            os.fsync(self._fd)
+        elif self.memory_file.exists():
+            with open(self.memory_file, "ab") as f:
+                os.fsync(f.fileno())
+    
+    def close(self) -> None:
+        """Write everything out, stop the writer and close the file.
+        A later store() starts them again."""
+        self.flush(sync=False)
+        if self._writer is not None:
+            self._batches.put(None)
+            self._writer.join()
+            self._writer = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        
+    @staticmethod
+    def _serialize(memory: LongTermMemory) -> bytes:
+        """Convert a memory to a newline-terminated JSON line.
+        orjson serializes the dataclass and its timestamp natively."""
+        return orjson.dumps(memory, option=orjson.OPT_APPEND_NEWLINE)
             
     def search_similar(self, query: str, limit: int = 5) -> List[LongTermMemory]:
         """Basic search implementation - just returns recent memories containing the query"""
-        memories = self._read_memories()
-        filtered = [m for m in memories if query.lower() in m.observation.lower()]
-        return filtered[-limit:]
+        query = query.lower()
+        matches = []
+        for memory in reversed(self._read_memories()):  # Newest first, stop once we have enough
+            if query in memory.observation.lower():
+                matches.append(memory)
+                if len(matches) == limit:
+                    break
+        matches.reverse()
+        return matches
     
     def get_recent(self, limit: int = 10) -> List[LongTermMemory]:
         """Get most recent memories"""
-        memories = self._read_memories()
-        return memories[-limit:]
+        return self._read_memories(limit)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get basic memory statistics"""
@@ -86,29 +251,65 @@ class JsonlMemoryStore(LongTermMemoryStore):
             "newest": memories[-1].timestamp.isoformat()
         }
         
-    def _read_memories(self) -> List[LongTermMemory]:
-        """Helper to read all memories from file"""
-        import json
+    def _read_memories(self, limit: Optional[int] = None) -> List[LongTermMemory]:
+        """Helper to get all memories (or the last `limit`), including ones not written yet"""
+        with self._lock:
+            self._read_new_lines()
+            # The file's tail only holds its newest memories if the file is in order
+            memories = self._memories[-limit:] if limit and self._in_order else self._memories[:]
+            written = len(memories)
+            memories.extend(self._in_flight)
+            memories.extend(self._buffer)
+        # Only sort if something was stored out of order, or unwritten memories predate the file's last
+        if not self._in_order or (0 < written < len(memories) and
+                                  memories[written].timestamp < memories[written - 1].timestamp):
+            memories.sort(key=lambda x: x.timestamp)
+        return memories[-limit:] if limit else memories
+        
+    def _read_new_lines(self) -> None:
+        """Parse memories appended to the file since the last read. Call with _lock held."""
         if not self.memory_file.exists():
-            return []
+            return
             
-        memories = []
-        with open(self.memory_file) as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    memories.append(LongTermMemory(
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
-                        event_type=data["event_type"],
-                        state=data["state"],
-                        observation=data["observation"],
-                        emotional_state=data["emotional_state"],
-                        context=data["context"]
-                    ))
-        return sorted(memories, key=lambda x: x.timestamp) 
+        with open(self.memory_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size < self._file_pos:  # File was replaced, start over
+                self._memories.clear()
+                self._file_pos = 0
+            f.seek(self._file_pos)
+            pending = b""
+            while chunk := f.read(READ_CHUNK_SIZE):
+                pending += chunk
+                end = pending.rfind(b"\n") + 1  # Carry a partial last line into the next chunk
+                for line in pending[:end].splitlines():
+                    if line.strip():
+                        memory = self._deserialize(line)
+                        if self._memories and memory.timestamp < self._memories[-1].timestamp:
+                            self._in_order = False
+                        self._memories.append(memory)
+                self._file_pos += end
+                pending = pending[end:]
+        
+    @staticmethod
+    def _deserialize(line: bytes) -> LongTermMemory:
+        """Parse a JSON line back into a memory"""
+        data = orjson.loads(line)
+        return LongTermMemory(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            event_type=data["event_type"],
+            state=data["state"],
+            observation=data["observation"],
+            emotional_state=data["emotional_state"],
+            context=data["context"]
+        )
         
     def get_session_summary(self) -> Dict[str, Any]:
         """Get summary statistics for the current session"""
+        if self._session_start and self._in_order:
+            return self._summarize_session(
+                self._session_start, self._session_last, self._session_counts, self._session_total
+            )
+            
+        # Session wasn't started through this store (or the clock jumped), scan the file
         memories = self._read_memories()
         if not memories:
             return {"error": "No memories found"}
@@ -130,21 +331,26 @@ class JsonlMemoryStore(LongTermMemoryStore):
         for memory in session_memories:
             event_counts[memory.event_type] = event_counts.get(memory.event_type, 0) + 1
             
+        return self._summarize_session(
+            session_start, session_memories[-1], event_counts, len(session_memories)
+        )
+        
+    @staticmethod
+    def _summarize_session(start: LongTermMemory, last: LongTermMemory,
+                           event_counts: Dict[str, int], total: int) -> Dict[str, Any]:
+        """Package a session's first and last memories and event counts as a summary"""
         # Calculate session duration
-        if session_memories[-1].event_type == "shutdown":
-            end_time = session_memories[-1].timestamp
+        if last.event_type == "shutdown":
+            end_time = last.timestamp
         else:
             end_time = datetime.now()
-        duration = end_time - session_start_time
-        
-        # Get final state from last memory
-        final_state = session_memories[-1].state
+        duration = end_time - start.timestamp
         
         return {
             "session_duration": duration.total_seconds(),
-            "total_memories": len(session_memories),
-            "event_counts": event_counts,
-            "final_state": final_state,
-            "start_time": session_start_time.isoformat(),
+            "total_memories": total,
+            "event_counts": dict(event_counts),
+            "final_state": last.state,  # Final state from last memory
+            "start_time": start.timestamp.isoformat(),
             "end_time": end_time.isoformat()
         } 
\ No newline at end of file
@@ -1,8 +1,9 @@
 """Memory system for AutoGnomes"""
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Optional
 from collections import deque
+import time
 
 @dataclass
 class MemoryEvent:
@@ -18,6 +19,9 @@ class ShortTermMemory:
         self.last_state: Optional[str] = None
         self.last_transition_time: Optional[datetime] = None
         self._last_record_time: Optional[datetime] = None
+        # Sliding windows of transition times (time.monotonic()), for O(1) pattern analysis
+        self._transitions_minute: deque[float] = deque()
+        self._transitions_5_minutes: deque[float] = deque()
     
     def record_state(self, state: str, details: str = "") -> Optional[MemoryEvent]:
         """Record a state and return a transition event if state changed"""
@@ -37,6 +41,11 @@ class ShortTermMemory:
                 details=f"Changed from {self.last_state} to {state}. {details}"
             )
             self.events.append(event)
+            transition_time = time.monotonic()
+            self._transitions_minute.append(transition_time)
+            self._transitions_5_minutes.append(transition_time)
+            self._count_since(self._transitions_minute, transition_time - 60)  # Keep windows bounded
+            self._count_since(self._transitions_5_minutes, transition_time - 300)
             self.last_state = state
             self.last_transition_time = now
             return event
@@ -48,24 +57,25 @@ class ShortTermMemory:
         
         return None
     
-    def get_recent_events(self, seconds: int) -> List[MemoryEvent]:
-        """Get events from the last n seconds"""
-        cutoff = datetime.now() - timedelta(seconds=seconds)
-        return [e for e in self.events if e.timestamp >= cutoff]
-    
     def get_state_duration(self) -> timedelta:
         """Get how long we've been in the current state"""
         if not self.last_transition_time:
             return timedelta(seconds=0)
         return datetime.now() - self.last_transition_time
     
+    @staticmethod
+    def _count_since(window: deque, cutoff: float) -> int:
+        """Drop transition times older than cutoff and count the rest"""
+        while window and window[0] < cutoff:
+            window.popleft()
+        return len(window)
+    
     def analyze_patterns(self) -> dict:
         """Analyze recent patterns in events"""
-        last_minute = self.get_recent_events(60)
-        last_5_minutes = self.get_recent_events(300)
+        now = time.monotonic()
         
         return {
-            "transitions_last_minute": len([e for e in last_minute if e.event_type == "transition"]),
-            "transitions_last_5_minutes": len([e for e in last_5_minutes if e.event_type == "transition"]),
+            "transitions_last_minute": self._count_since(self._transitions_minute, now - 60),
+            "transitions_last_5_minutes": self._count_since(self._transitions_5_minutes, now - 300),
             "current_state_duration": self.get_state_duration().total_seconds()
         } 
\ No newline at end of file
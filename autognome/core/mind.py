@@ -4,7 +4,7 @@ from datetime import datetime
 import asyncio
 import random
 
-@dataclass
+@dataclass(slots=True)
 class ActionContext:
     """Context provided to the mind for decision making"""
     state: Dict[str, Any]  # Current autognome state
@@ -14,7 +14,7 @@ class ActionContext:
     conversation: List[Dict[str, Any]]  # Recent messages
     last_user_message: Optional[datetime]
 
-@dataclass 
+@dataclass(slots=True)
 class ActionResult:
     """Result of executing an action"""
     success: bool
@@ -23,6 +23,9 @@ class ActionResult:
 
 class Action(Protocol):
     """Base protocol for all actions"""
+    # Whether execute() can run concurrently with other actions in a pulse
+    parallel_safe: bool = False
+    
     async def execute(self, context: ActionContext) -> ActionResult:
         ...
     
@@ -33,6 +36,8 @@ class Action(Protocol):
 
 class Speak(Action):
     """Action to speak a message"""
+    parallel_safe = True
+    
     def __init__(self, message: str):
         self.message = message
         
@@ -68,6 +73,8 @@ class Rest(Action):
 
 class Research(Action):
     """Mock research action"""
+    parallel_safe = True
+    
     def __init__(self, query: str):
         self.query = query
         
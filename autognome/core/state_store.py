@@ -3,7 +3,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
-import json
+import orjson
+import os
+import threading
+from .long_term_memory import LongTermMemoryStore
 
 @dataclass
 class PersistentState:
@@ -30,47 +33,72 @@ class PersistentState:
         if data['last_hibernation']:
             data['last_hibernation'] = datetime.fromisoformat(data['last_hibernation'])
         return cls(**data)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert state to dictionary with datetime serialization"""
-        data = {
-            "energy_level": self.energy_level,
-            "emotional_state": self.emotional_state,
-            "last_light_level": self.last_light_level,
-            "last_active": self.last_active.isoformat(),
-            "last_hibernation": self.last_hibernation.isoformat() if self.last_hibernation else None,
-            "total_pulses": self.total_pulses,
-            "total_rests": self.total_rests,
-            "total_runtime": self.total_runtime,
-            "total_hibernation_time": self.total_hibernation_time,
-            "wake_count": self.wake_count
-        }
-        return data
 
 class StateStore(ABC):
     """Abstract interface for persistent state storage"""
     
     @abstractmethod
-    def save_state(self, state: PersistentState) -> None:
-        """Save the current state"""
+    def save_state(self, state: PersistentState, seq: Optional[int] = None) -> None:
+        """Save the current state. If given, `seq` orders snapshots: a state
+        older than one already saved is skipped."""
         pass
     
     @abstractmethod
     def load_state(self) -> Optional[PersistentState]:
         """Load the last saved state if it exists"""
         pass
+    
+    @abstractmethod
+    def save_and_flush_memories(self, state: PersistentState, memories: LongTermMemoryStore,
+                                seq: Optional[int] = None) -> None:
+        """Flush buffered memories and save the final state in one durable step"""
+        pass
 
 class JsonStateStore(StateStore):
-    """Simple JSON implementation for state persistence"""
+    """Simple JSON implementation for state persistence.
+    
+    State is written as compact JSON; set AG_PRETTY_STATE=1 to indent it
+    for debugging."""
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
         self.state_file = state_dir / "state.json"
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._dump_option = orjson.OPT_INDENT_2 if os.getenv("AG_PRETTY_STATE") == "1" else None
+        self._lock = threading.Lock()
+        self._last_seq: Optional[int] = None  # Sequence number of the last state written
+    
+    def save_state(self, state: PersistentState, seq: Optional[int] = None) -> None:
+        """Save state to JSON file. Safe to call from a worker thread."""
+        self._write_state(state, seq, sync=False)
+    
+    def save_and_flush_memories(self, state: PersistentState, memories: LongTermMemoryStore,
+                                seq: Optional[int] = None) -> None:
+        """Write buffered memories, then atomically replace the state file,
+        syncing the files and the directory once at the end"""
+        memories.flush(sync=False)
+        self._write_state(state, seq, sync=True)
+        memories.sync()
+        if hasattr(os, "O_DIRECTORY"):  # Directories can't be opened on Windows
+            dir_fd = os.open(self.state_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
     
-    def save_state(self, state: PersistentState) -> None:
-        """Save state to JSON file"""
-        with open(self.state_file, 'w') as f:
-            json.dump(state.to_dict(), f, indent=2)
+    def _write_state(self, state: PersistentState, seq: Optional[int], sync: bool) -> None:
+        """Atomically replace the state file, unless a newer state was already written"""
+        with self._lock:
+            if seq is not None and self._last_seq is not None and seq < self._last_seq:
+                return  # A checkpoint finishing late must not overwrite the final state
+            tmp_file = self.state_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(state, option=self._dump_option))
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            if seq is not None:
+                self._last_seq = seq
     
     def load_state(self) -> Optional[PersistentState]:
         """Load state from JSON file if it exists"""
@@ -78,8 +106,8 @@ class JsonStateStore(StateStore):
             return None
             
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
+            with open(self.state_file, 'rb') as f:
+                data = orjson.loads(f.read())
             return PersistentState.from_dict(data)
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             return None 
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Environment sensor system for AutoGnomes"""
+import asyncio
 import os
 from pathlib import Path
 from typing import Literal
@@ -24,6 +25,10 @@ class EnvironmentSensor:
         level = self.light_sensor_path.read_text().strip().lower()
         return "light" if level == "light" else "dark"
 
+    async def aread_light_level(self) -> LightLevel:
+        """Read the current light level without blocking the event loop"""
+        return await asyncio.to_thread(self.read_light_level)
+
     def set_light_level(self, level: LightLevel) -> None:
         """Set the light level (for testing/simulation)"""
         self.light_sensor_path.write_text(level) 
\ No newline at end of file
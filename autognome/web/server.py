@@ -4,11 +4,10 @@ from fastapi.responses import FileResponse
 import asyncio
 from loguru import logger
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional
 from ..core.autognome import Autognome
 from ..core.loader import AutognomeLoader
 from ..core.mind import Speak, Rest
-import random
 
 app = FastAPI()
 app.mount("/static", StaticFiles(directory=Path(__file__).parent / "static"), name="static")
@@ -16,7 +15,6 @@ app.mount("/static", StaticFiles(directory=Path(__file__).parent / "static"), na
 # Store current autognome instance in app state
 app.state.current_autognome: Optional[Autognome] = None
 app.state.websocket: Optional[WebSocket] = None
-app.state.ascii_art_cache: Dict[str, str] = {}  # Cache for ASCII art
 app.state.pulse_task: Optional[asyncio.Task] = None
 
 @app.on_event("startup")
@@ -38,21 +36,6 @@ async def shutdown_event():
     if app.state.current_autognome:
         app.state.current_autognome.stop()
 
-def load_ascii_art(art_path: str, base_dir: Path) -> str:
-    """Load ASCII art from file, using cache if available"""
-    cache_key = str(base_dir / art_path)
-    if cache_key in app.state.ascii_art_cache:
-        return app.state.ascii_art_cache[cache_key]
-        
-    try:
-        with open(base_dir / art_path) as f:
-            art = f.read()
-            app.state.ascii_art_cache[cache_key] = art
-            return art
-    except Exception as e:
-        print(f"Error loading ASCII art from {art_path}: {e}")
-        return "ERROR: Could not load ASCII art"
-
 @app.get("/")
 async def get_index():
     """Serve the index.html file"""
@@ -89,9 +72,11 @@ async def start_autognome(version: str):
         except asyncio.CancelledError:
             pass
             
+    # Stop the autognome being replaced, so its memories and state are saved
+    if app.state.current_autognome:
+        app.state.current_autognome.stop()
+            
     app.state.current_autognome = Autognome(config=config)
-    # Clear ASCII art cache on new instance
-    app.state.ascii_art_cache.clear()
     
     # Start pulse task
     app.state.pulse_task = asyncio.create_task(pulse_loop())
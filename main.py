@@ -11,6 +11,14 @@ from autognome.core.loader import AutognomeLoader
 from autognome.core.autognome import Autognome
 import asyncio
 
+# Use uvloop for the event loop driving the pulse loop when available
+# (it is not supported on Windows, where we fall back to the stdlib loop)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 # Configure loguru
 logger.remove()  # Remove default handler
 logger.add(
@@ -159,6 +167,11 @@ if __name__ == "__main__":
     threading.Thread(target=open_browser, daemon=True).start()
     
     # Run the server with graceful shutdown
-    config = uvicorn.Config(app, host="127.0.0.1", port=8000)
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        loop="uvloop" if uvloop else "asyncio"
+    )
     server = uvicorn.Server(config)
     server.run()
\ No newline at end of file